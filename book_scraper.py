@@ -1,11 +1,22 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import aiohttp
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from selectolax.lexbor import LexborHTMLParser
 import csv
 import json
 import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to stdlib json
 import random
+from dataclasses import dataclass, asdict
 from urllib.parse import urljoin
-from typing import List, Dict
+from typing import List
 import logging
 
 # Setup logging
@@ -15,6 +26,37 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# CSS selectors used on every page, defined once at module scope
+_SEL_ARTICLES = 'article.product_pod'
+_SEL_TITLE = 'h3 a'
+_SEL_IMG = 'img'
+_SEL_NEXT = 'li.next a'
+_SEL_CURRENT = 'li.current'
+
+# Star-rating CSS class word -> digit, built once at import time
+_RATING_MAP = {
+    'One': '1',
+    'Two': '2',
+    'Three': '3',
+    'Four': '4',
+    'Five': '5'
+}
+
+
+@dataclass(slots=True)
+class Book:
+    """
+    One scraped book record
+    Slots storage is far lighter than a per-book dict and keeps field
+    access a fixed-offset load during export
+    """
+    title: str
+    product_url: str
+    price: str
+    rating: str
+    availability: str
+    image_url: str
+
 
 class BookScraper:
     """
@@ -22,137 +64,199 @@ class BookScraper:
     Extracts book data with pagination handling and exports to CSV/JSON
     """
     
-    def __init__(self, base_url: str = "https://books.toscrape.com/"):
+    def __init__(self, base_url: str = "https://books.toscrape.com/",
+                 delay_range: tuple = (0, 0), ndjson_path: str = None):
         self.base_url = base_url
+        # Cached site root for resolving ../../media/... image paths
+        # without a full urljoin parse per book
+        self._media_base = base_url.rstrip('/') + '/'
+        self.max_retries = 3
+        self.max_concurrency = 20  # Cap on simultaneous requests
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            # Gzipped responses cut bytes-on-wire ~5x; requests
+            # decompresses transparently
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive'
         })
-        self.books_data: List[Dict] = []
-        self.max_retries = 3
-        self.delay_range = (1, 3)  # Random delay between 1-3 seconds
+        # Transport-level retries with exponential backoff, handled by
+        # urllib3 so get_page doesn't need its own retry logic; pool size
+        # matches max_concurrency so threaded workers reuse sockets
+        adapter = HTTPAdapter(
+            pool_connections=self.max_concurrency,
+            pool_maxsize=self.max_concurrency,
+            max_retries=Retry(
+                total=self.max_retries,
+                backoff_factor=1,
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=['GET']
+            ))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.books_data: List[Book] = []
+        # books.toscrape.com is a scraping sandbox with no rate limits, so
+        # no delay by default; pass e.g. delay_range=(1, 3) for real sites
+        self.delay_range = delay_range
+        # Optional NDJSON stream: each book is written to disk as soon as
+        # it is scraped, so a crawl can be killed/resumed without losing
+        # completed records
+        self._ndjson = open(ndjson_path, 'wb', buffering=262144) if ndjson_path else None
         
-    def get_page(self, url: str, retry_count: int = 0) -> BeautifulSoup:
+    def get_page(self, url: str) -> LexborHTMLParser:
         """
-        Fetch page with error handling and retry logic
+        Fetch page with error handling
+        Retries happen at the transport level via the session's adapter
         """
         try:
             logger.info(f"Fetching: {url}")
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            
-            # Add delay to be respectful
-            delay = random.uniform(*self.delay_range)
-            time.sleep(delay)
-            
-            return BeautifulSoup(response.content, 'html.parser')
+
+            # Add delay to be respectful (skipped when throttling is off)
+            if max(self.delay_range) > 0:
+                time.sleep(random.uniform(*self.delay_range))
+
+            # Raw bytes go straight to Lexbor: the site is always UTF-8,
+            # so skip requests' charset detection (response.text) entirely
+            return LexborHTMLParser(response.content)
             
         except requests.RequestException as e:
-            if retry_count < self.max_retries:
-                logger.warning(f"Request failed, retrying... ({retry_count + 1}/{self.max_retries})")
-                time.sleep(2 ** retry_count)  # Exponential backoff
-                return self.get_page(url, retry_count + 1)
-            else:
-                logger.error(f"Failed to fetch {url} after {self.max_retries} retries: {e}")
-                raise
+            logger.error(f"Failed to fetch {url} after {self.max_retries} retries: {e}")
+            raise
     
-    def extract_rating(self, article) -> str:
+    def _record_book(self, book: Book):
         """
-        Extract star rating from book article
+        Store a scraped book and stream it to NDJSON if enabled
         """
-        rating_map = {
-            'One': '1',
-            'Two': '2',
-            'Three': '3',
-            'Four': '4',
-            'Five': '5'
-        }
-        
-        rating_elem = article.find('p', class_='star-rating')
-        if rating_elem:
-            for rating_text, rating_num in rating_map.items():
-                if rating_text in rating_elem.get('class', []):
-                    return rating_num
+        self.books_data.append(book)
+        if self._ndjson is not None:
+            if orjson is not None:
+                # orjson serializes dataclasses natively
+                self._ndjson.write(orjson.dumps(book) + b'\n')
+            else:
+                self._ndjson.write(
+                    json.dumps(asdict(book), ensure_ascii=False).encode('utf-8') + b'\n')
+
+    def close(self):
+        """
+        Flush and close the NDJSON stream if one is open
+        """
+        if self._ndjson is not None:
+            self._ndjson.close()
+            self._ndjson = None
+
+    def extract_rating(self, rating_elem) -> str:
+        """
+        Extract star rating from the article's star-rating element
+        The class attribute is always 'star-rating <Word>', so the rating
+        is just the last token - one split and one dict lookup
+        """
+        if rating_elem is not None:
+            cls_str = rating_elem.attributes.get('class') or ''
+            if cls_str:
+                return _RATING_MAP.get(cls_str.split()[-1], 'N/A')
         return 'N/A'
     
-    def extract_book_data(self, article, page_url: str) -> Dict:
+    def extract_book_data(self, article, page_base: str) -> Book:
         """
         Extract all required data from a book article element
+        `page_base` is the page's directory URL (trailing slash), computed
+        once per page by the caller
         """
-        book_data = {}
-        
         # Title
-        title_elem = article.find('h3').find('a')
-        book_data['title'] = title_elem.get('title', 'N/A')
-        
-        # Product detail page link
-        relative_link = title_elem.get('href', '')
-        book_data['product_url'] = urljoin(page_url, relative_link)
-        
+        title_elem = article.css_first(_SEL_TITLE)
+        title = title_elem.attributes.get('title', 'N/A')
+
+        # Product detail page link - listing hrefs are plain relative
+        # filenames, so a string concat replaces urljoin in the hot loop
+        relative_link = title_elem.attributes.get('href', '') or ''
+        if '://' in relative_link or relative_link.startswith(('/', '..')):
+            product_url = urljoin(page_base, relative_link)
+        else:
+            product_url = page_base + relative_link
+
+        # Walk the article's <p> children once instead of running a
+        # separate subtree search per field
+        price_elem = rating_elem = stock_elem = None
+        for p_elem in article.css('p'):
+            p_class = p_elem.attributes.get('class') or ''
+            if 'price_color' in p_class:
+                price_elem = p_elem
+            elif 'star-rating' in p_class:
+                rating_elem = p_elem
+            elif 'availability' in p_class:
+                stock_elem = p_elem
+
         # Price
-        price_elem = article.find('p', class_='price_color')
-        book_data['price'] = price_elem.text.strip() if price_elem else 'N/A'
-        
+        price = price_elem.text().strip() if price_elem else 'N/A'
+
         # Rating
-        book_data['rating'] = self.extract_rating(article)
-        
+        rating = self.extract_rating(rating_elem)
+
         # Stock availability
-        stock_elem = article.find('p', class_='instock availability')
         if stock_elem:
-            stock_text = stock_elem.text.strip()
-            book_data['availability'] = 'In stock' if 'in stock' in stock_text.lower() else 'Out of stock'
+            stock_text = stock_elem.text().strip()
+            availability = 'In stock' if 'in stock' in stock_text.lower() else 'Out of stock'
         else:
-            book_data['availability'] = 'Unknown'
-        
+            availability = 'Unknown'
+
         # Image URL
-        img_elem = article.find('img')
+        img_elem = article.css_first(_SEL_IMG)
         if img_elem:
-            relative_img = img_elem.get('src', '')
-            book_data['image_url'] = urljoin(self.base_url, relative_img)
+            relative_img = img_elem.attributes.get('src', '') or ''
+            if relative_img.startswith(('http', '/')):
+                image_url = urljoin(self.base_url, relative_img)
+            else:
+                # Image srcs are always ../../media/..., so strip the leading
+                # dots/slashes and prepend the cached site root
+                image_url = self._media_base + relative_img.lstrip('./')
         else:
-            book_data['image_url'] = 'N/A'
-        
-        return book_data
+            image_url = 'N/A'
+
+        return Book(title, product_url, price, rating, availability, image_url)
     
-    def scrape_page(self, page_url: str) -> int:
+    def scrape_page(self, page_url: str):
         """
         Scrape all books from a single page
-        Returns the number of books scraped
+        Returns the number of books scraped and the parsed page
+        so callers can reuse it for next-page discovery
         """
         try:
             soup = self.get_page(page_url)
-            
+
             # Find all book articles
-            articles = soup.find_all('article', class_='product_pod')
-            
+            articles = soup.css(_SEL_ARTICLES)
+
+            # Directory of the current page, computed once for all articles
+            page_base = page_url.rsplit('/', 1)[0] + '/'
+
             for article in articles:
                 try:
-                    book_data = self.extract_book_data(article, page_url)
-                    self.books_data.append(book_data)
+                    book_data = self.extract_book_data(article, page_base)
+                    self._record_book(book_data)
                 except Exception as e:
                     logger.error(f"Error extracting book data: {e}")
                     continue
-            
+
             logger.info(f"Scraped {len(articles)} books from page")
-            return len(articles)
-            
+            return len(articles), soup
+
         except Exception as e:
             logger.error(f"Error scraping page {page_url}: {e}")
-            return 0
+            return 0, None
     
-    def get_next_page_url(self, soup: BeautifulSoup, current_url: str) -> str:
+    def get_next_page_url(self, soup: LexborHTMLParser, current_url: str) -> str:
         """
         Find the next page URL from pagination
         """
-        next_button = soup.find('li', class_='next')
-        if next_button:
-            next_link = next_button.find('a')
-            if next_link:
-                relative_url = next_link.get('href', '')
-                return urljoin(current_url, relative_url)
+        next_link = soup.css_first(_SEL_NEXT)
+        if next_link:
+            relative_url = next_link.attributes.get('href', '')
+            return urljoin(current_url, relative_url)
         return None
     
-    def scrape_books(self, min_books: int = 500) -> List[Dict]:
+    def scrape_books(self, min_books: int = 500) -> List[Book]:
         """
         Main scraping function with pagination
         Scrapes until minimum number of books is reached
@@ -167,35 +271,144 @@ class BookScraper:
             logger.info(f"Scraping page {page_count} - Total books: {len(self.books_data)}")
             
             # Scrape current page
-            books_scraped = self.scrape_page(current_url)
-            
+            books_scraped, soup = self.scrape_page(current_url)
+
             if books_scraped == 0:
                 logger.warning("No books found on page, stopping")
                 break
-            
+
             # Check if we've reached the target
             if len(self.books_data) >= min_books:
                 logger.info(f"Target reached! Scraped {len(self.books_data)} books")
                 break
-            
-            # Get next page URL
-            try:
-                soup = self.get_page(current_url)
-                next_url = self.get_next_page_url(soup, current_url)
-                
-                if not next_url:
-                    logger.info("No more pages to scrape")
-                    break
-                
-                current_url = next_url
-                
-            except Exception as e:
-                logger.error(f"Error finding next page: {e}")
+
+            # Reuse the page we just parsed to find the next page URL
+            next_url = self.get_next_page_url(soup, current_url)
+
+            if not next_url:
+                logger.info("No more pages to scrape")
                 break
+
+            current_url = next_url
         
         logger.info(f"Scraping complete! Total books: {len(self.books_data)}")
         return self.books_data
-    
+
+    def get_num_pages(self, soup: LexborHTMLParser) -> int:
+        """
+        Read the total page count from the "Page 1 of 50" pager text
+        """
+        current = soup.css_first(_SEL_CURRENT)
+        if current:
+            try:
+                return int(current.text().strip().split()[-1])
+            except ValueError:
+                pass
+        return 1
+
+    async def _fetch_page(self, session: aiohttp.ClientSession, url: str,
+                          semaphore: asyncio.Semaphore,
+                          stagger: float = 0.0) -> LexborHTMLParser:
+        """
+        Fetch a single page, capped by the shared concurrency semaphore
+        Each worker's first request is offset by `stagger` seconds so the
+        initial burst doesn't hit the server all at once
+        """
+        if stagger:
+            await asyncio.sleep(stagger)
+        async with semaphore:
+            logger.info(f"Fetching: {url}")
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                response.raise_for_status()
+                # Read raw bytes; Lexbor handles UTF-8 itself, so no
+                # Python-level decode/charset detection is needed
+                content = await response.read()
+        return LexborHTMLParser(content)
+
+    async def _scrape_books_async(self, min_books: int) -> List[Book]:
+        """
+        Fetch all catalogue pages concurrently and extract their books
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with aiohttp.ClientSession(headers=dict(self.session.headers)) as session:
+            # Page 1 tells us how many pages exist ("Page 1 of 50")
+            first_url = urljoin(self.base_url, 'catalogue/page-1.html')
+            first_page = await self._fetch_page(session, first_url, semaphore)
+            num_pages = self.get_num_pages(first_page)
+
+            page_urls = [
+                urljoin(self.base_url, f'catalogue/page-{i}.html')
+                for i in range(2, num_pages + 1)
+            ]
+            results = await asyncio.gather(
+                *(self._fetch_page(session, url, semaphore,
+                                   stagger=(i % self.max_concurrency) * 0.1)
+                  for i, url in enumerate(page_urls)),
+                return_exceptions=True
+            )
+
+        for page_url, tree in zip([first_url] + page_urls, [first_page] + list(results)):
+            if len(self.books_data) >= min_books:
+                break
+            if isinstance(tree, Exception):
+                logger.error(f"Error fetching {page_url}: {tree}")
+                continue
+            page_base = page_url.rsplit('/', 1)[0] + '/'
+            for article in tree.css(_SEL_ARTICLES):
+                try:
+                    self._record_book(self.extract_book_data(article, page_base))
+                except Exception as e:
+                    logger.error(f"Error extracting book data: {e}")
+                    continue
+
+        return self.books_data
+
+    def scrape_books_concurrent(self, min_books: int = 500) -> List[Book]:
+        """
+        Concurrent version of scrape_books using aiohttp + asyncio.gather
+        All catalogue pages are fetched in parallel instead of waiting
+        on each request in turn
+        """
+        logger.info(f"Starting concurrent scrape - Target: {min_books} books")
+        asyncio.run(self._scrape_books_async(min_books))
+        logger.info(f"Scraping complete! Total books: {len(self.books_data)}")
+        return self.books_data
+
+    def scrape_books_threaded(self, min_books: int = 500) -> List[Book]:
+        """
+        Thread-pool alternative to scrape_books_concurrent
+        The workload is I/O-bound, so threads sidestep the GIL, and the
+        shared requests.Session is thread-safe for GETs - no asyncio
+        machinery needed
+        """
+        logger.info(f"Starting threaded scrape - Target: {min_books} books")
+
+        first_url = urljoin(self.base_url, 'catalogue/page-1.html')
+        first_page = self.get_page(first_url)
+        num_pages = self.get_num_pages(first_page)
+
+        page_urls = [
+            urljoin(self.base_url, f'catalogue/page-{i}.html')
+            for i in range(2, num_pages + 1)
+        ]
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            soups = list(executor.map(self.get_page, page_urls))
+
+        # Extraction is CPU-bound, so it stays in the main thread
+        for page_url, soup in zip([first_url] + page_urls, [first_page] + soups):
+            if len(self.books_data) >= min_books:
+                break
+            page_base = page_url.rsplit('/', 1)[0] + '/'
+            for article in soup.css(_SEL_ARTICLES):
+                try:
+                    self._record_book(self.extract_book_data(article, page_base))
+                except Exception as e:
+                    logger.error(f"Error extracting book data: {e}")
+                    continue
+
+        logger.info(f"Scraping complete! Total books: {len(self.books_data)}")
+        return self.books_data
+
     def export_to_csv(self, filename: str = "books_data.csv"):
         """
         Export scraped data to CSV file
@@ -207,27 +420,47 @@ class BookScraper:
         fieldnames = ['title', 'price', 'rating', 'availability', 'product_url', 'image_url']
         
         try:
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(self.books_data)
-            
+            # Large write buffer cuts syscalls
+            with open(filename, 'w', newline='', encoding='utf-8',
+                      buffering=65536) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(fieldnames)
+                # Pre-built tuples avoid DictWriter's per-field dict lookup,
+                # and materializing the list once lets the csv module's C
+                # loop process the whole batch without Python callbacks
+                rows = [(b.title, b.price, b.rating, b.availability,
+                         b.product_url, b.image_url) for b in self.books_data]
+                writer.writerows(rows)
+
             logger.info(f"Data exported to {filename}")
         except Exception as e:
             logger.error(f"Error exporting to CSV: {e}")
     
-    def export_to_json(self, filename: str = "books_data.json"):
+    def export_to_json(self, filename: str = "books_data.json", pretty: bool = False):
         """
         Export scraped data to JSON file
+        Uses orjson (C-based, emits UTF-8 bytes directly) when available
         """
         if not self.books_data:
             logger.warning("No data to export")
             return
-        
+
         try:
-            with open(filename, 'w', encoding='utf-8') as jsonfile:
-                json.dump(self.books_data, jsonfile, indent=2, ensure_ascii=False)
-            
+            if orjson is not None:
+                # orjson serializes the Book dataclasses natively
+                option = orjson.OPT_INDENT_2 if pretty else 0
+                with open(filename, 'wb') as jsonfile:
+                    jsonfile.write(orjson.dumps(self.books_data, option=option))
+            else:
+                # Compact output: pretty-printing doubles file size and is
+                # far slower to encode
+                with open(filename, 'w', encoding='utf-8',
+                          buffering=65536) as jsonfile:
+                    json.dump([asdict(book) for book in self.books_data],
+                              jsonfile, ensure_ascii=False,
+                              indent=2 if pretty else None,
+                              separators=None if pretty else (',', ':'))
+
             logger.info(f"Data exported to {filename}")
         except Exception as e:
             logger.error(f"Error exporting to JSON: {e}")
@@ -245,11 +478,11 @@ def main():
     print("Book Scraper - books.toscrape.com")
     print("=" * 60)
     print("\nNote: This website allows scraping (check robots.txt)")
-    print("Implementing responsible scraping with delays...\n")
+    print("Fetching pages concurrently with staggered request starts...\n")
     
     # Scrape books
     try:
-        books = scraper.scrape_books(min_books=500)
+        books = scraper.scrape_books_concurrent(min_books=500)
         
         print(f"\n{'=' * 60}")
         print(f"Successfully scraped {len(books)} books!")
@@ -264,11 +497,11 @@ def main():
         print("-" * 60)
         for i, book in enumerate(books[:3], 1):
             print(f"\nBook {i}:")
-            print(f"  Title: {book['title']}")
-            print(f"  Price: {book['price']}")
-            print(f"  Rating: {book['rating']} stars")
-            print(f"  Availability: {book['availability']}")
-            print(f"  URL: {book['product_url']}")
+            print(f"  Title: {book.title}")
+            print(f"  Price: {book.price}")
+            print(f"  Rating: {book.rating} stars")
+            print(f"  Availability: {book.availability}")
+            print(f"  URL: {book.product_url}")
         
         print(f"\n{'=' * 60}")
         print("Data exported to:")